@@ -1,5 +1,8 @@
 import os
+import json
+from datetime import datetime
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 
 # R2 Configuration
@@ -21,27 +24,34 @@ r2_client = boto3.client(
     region_name='auto'
 )
 
+# Content types by file extension
+CONTENT_TYPES = {
+    '.md': 'text/markdown',
+    '.json': 'application/json',
+    '.txt': 'text/plain'
+}
+
+# Multipart transfer settings for large artifacts
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    max_concurrency=8,
+    use_threads=True
+)
+
 def uploadFile(local_path: str, remote_path: str):
-    """Upload a file to R2 bucket"""
-    with open(local_path, "rb") as f:
-        response = r2_client.put_object(
-            Bucket=R2_BUCKET_NAME,
-            Key=remote_path,
-            Body=f,
-            ContentType=get_content_type(local_path)
-        )
-    return response
+    """Upload a file to R2 bucket (multipart for files above the threshold)"""
+    r2_client.upload_file(
+        local_path,
+        R2_BUCKET_NAME,
+        remote_path,
+        ExtraArgs={'ContentType': get_content_type(local_path)},
+        Config=TRANSFER_CONFIG
+    )
 
 def get_content_type(path: str) -> str:
     """Determine content type based on file extension"""
-    if path.endswith('.md'):
-        return 'text/markdown'
-    elif path.endswith('.json'):
-        return 'application/json'
-    elif path.endswith('.txt'):
-        return 'text/plain'
-    else:
-        return 'application/octet-stream'
+    extension = os.path.splitext(path)[1].lower()
+    return CONTENT_TYPES.get(extension, 'application/octet-stream')
 
 def uploadDocument(project_name: str, version: str, doc_path: str, metadata: dict = None):
     """
@@ -53,9 +63,6 @@ def uploadDocument(project_name: str, version: str, doc_path: str, metadata: dic
         doc_path: Local path to the markdown document
         metadata: Optional metadata dictionary
     """
-    import json
-    from datetime import datetime
-    
     # Upload the document
     doc_filename = os.path.basename(doc_path)
     remote_doc_path = f"{project_name}/{version}/{doc_filename}"
@@ -64,10 +71,11 @@ def uploadDocument(project_name: str, version: str, doc_path: str, metadata: dic
     
     # Upload metadata if provided
     if metadata:
+        now = datetime.utcnow().isoformat() + "Z"
         metadata_with_defaults = {
             "version": version,
-            "createdAt": datetime.utcnow().isoformat() + "Z",
-            "updatedAt": datetime.utcnow().isoformat() + "Z",
+            "createdAt": now,
+            "updatedAt": now,
             "tags": [],
             **metadata
         }